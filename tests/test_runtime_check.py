@@ -7,8 +7,14 @@ import sys
 # Make src/ importable when running tests without installing the package.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
+import functools  # noqa: E402
+import inspect  # noqa: E402
+import subprocess  # noqa: E402
+
+from typing import Any, TypeVar  # noqa: E402
+
 import pytest  # type: ignore  # noqa: E402
-from runtime_check import runtime_check  # noqa: E402
+from runtime_check import _annotation_cache, _emit_wrapper_source, runtime_check  # noqa: E402
 
 
 @runtime_check
@@ -51,3 +57,335 @@ def test_collect_tuple_variants_and_set():
     assert out2["z"] == 3
     with pytest.raises(TypeError):
         collect(("1", 2), {"bad"})  # type: ignore[arg-type]
+
+
+@runtime_check
+def lookup(table: dict[str, list[int]], key: str | None = None) -> int | None:
+    return None if key is None else sum(table[key])
+
+
+def test_lookup_nested_dict_and_optional():
+    assert lookup({"a": [1, 2]}, "a") == 3
+    assert lookup({"a": [1, 2]}) is None
+    with pytest.raises(TypeError):
+        lookup({"a": [1, "2"]}, "a")  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        lookup({"a": [1]}, 1)  # type: ignore[arg-type]
+
+
+@runtime_check
+def join(sep: str, /, *parts: str, upper: bool = False, **extra: int) -> str:
+    text = sep.join(parts) + "".join(str(v) for v in extra.values())
+    return text.upper() if upper else text
+
+
+def test_join_binds_variadic_and_keyword_only():
+    assert join("-", "a", "b") == "a-b"
+    assert join("-", "a", upper=True, n=1) == "A1"
+    with pytest.raises(TypeError):
+        join("-", "a", 1)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        join("-", n="1")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        join(sep="-")  # type: ignore[call-arg]
+
+
+@runtime_check
+def size(item: int | float | list[str]) -> int | float:
+    return len(item) if isinstance(item, list) else item
+
+
+def test_size_class_and_generic_union_members():
+    assert size(3) == 3 and size(1.5) == 1.5 and size(["a"]) == 1
+    with pytest.raises(TypeError):
+        size("a")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        size([1])  # type: ignore[list-item]
+
+
+@runtime_check(sample=2)
+def add_sampled(numbers: list[int]) -> int:
+    return len(numbers)
+
+
+def test_sample_checks_only_head_and_tail():
+    assert add_sampled(list(range(10))) == 10
+    # Elements between the sampled head and tail are not inspected
+    assert add_sampled([1, 2, "x", 4, 5]) == 5  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        add_sampled(["x", 2, 3, 4, 5])  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        add_sampled([1, 2, 3, 4, "x"])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        runtime_check(sample=0)
+    with pytest.raises(ValueError):
+        runtime_check(sample=1.5)  # type: ignore[call-overload]
+    with pytest.raises(ValueError):
+        runtime_check(sample=True)
+
+
+def test_error_message_truncates_large_values():
+    with pytest.raises(TypeError, match=r"Argument 'numbers'.*\.\.\.") as exc:
+        add_all(list(range(10_000)) + ["x"])  # type: ignore[list-item]
+    assert len(str(exc.value)) < 200
+
+
+def test_unannotated_function_is_returned_unchanged():
+    def plain(x, y=1):  # type: ignore[no-untyped-def]
+        return x + y
+
+    assert runtime_check(plain) is plain
+
+
+def test_return_only_annotation_passes_arguments_through():
+    @runtime_check
+    def echo(x, *, y=0) -> int:  # type: ignore[no-untyped-def]
+        return x + y
+
+    assert echo(1, y=2) == 3
+    with pytest.raises(TypeError):
+        echo(1.5)
+
+
+def test_disabled_returns_function_unchanged(monkeypatch):
+    monkeypatch.setattr("runtime_check._DISABLED", True)
+
+    def shout(text: str) -> str:
+        return text.upper()
+
+    assert runtime_check(shout) is shout
+    assert runtime_check(sample=3)(shout) is shout
+
+
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_DISABLED_PROBE = f"""
+import sys
+sys.path.insert(0, {_SRC_DIR!r})
+from runtime_check import runtime_check
+
+def f(x: int) -> int:
+    return x
+
+print(runtime_check(f) is f)
+"""
+
+
+@pytest.mark.parametrize(
+    ("flags", "env", "disabled"),
+    [([], {"RUNTIME_CHECK_DISABLE": "1"}, True), (["-O"], {}, True), ([], {}, False)],
+    ids=["env-var", "optimize", "enabled"],
+)
+def test_disabled_at_import(flags, env, disabled):
+    environ = {k: v for k, v in os.environ.items() if k != "RUNTIME_CHECK_DISABLE"}
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", _DISABLED_PROBE],
+        env={**environ, **env},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == str(disabled)
+
+
+def test_strict_matches_builtin_classes_exactly():
+    @runtime_check(strict=True)
+    def scale(n: int, xs: list[int], tag: str | None = None) -> list[int]:
+        return [n * x for x in xs]
+
+    assert scale(2, [1, True]) == [2, 2]  # elements keep isinstance semantics
+    assert runtime_check(scale.__wrapped__)(True, [1]) == [1]  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        scale(True, [1])
+    with pytest.raises(TypeError):
+        scale(2, [1], tag=type("S", (str,), {})("x"))
+
+    @runtime_check(strict=True)
+    def tally(*xs: int, **kw: int) -> int:
+        return sum(xs) + sum(kw.values())
+
+    assert tally(1, 2, k=3) == 6
+    with pytest.raises(TypeError):
+        tally(True)
+    with pytest.raises(TypeError):
+        tally(1, k=True)
+
+
+def test_strict_applies_to_each_union_member():
+    class MyList(list):  # type: ignore[type-arg]
+        pass
+
+    @runtime_check(strict=True)
+    def head(xs: list[int] | None, n: int | list[int] = 0) -> int:
+        return xs[0] if xs else n if isinstance(n, int) else len(n)
+
+    assert head([3]) == 3 and head(None, [1, 2]) == 2
+    with pytest.raises(TypeError):
+        head(MyList([1]))
+    with pytest.raises(TypeError):
+        head(None, True)
+    with pytest.raises(TypeError):
+        head(None, MyList())
+
+
+def test_wrapper_preserves_metadata():
+    assert greet.__name__ == "greet"
+    assert greet.__qualname__ == "greet"
+    assert greet.__module__ == __name__
+    assert greet.__annotations__ == {"name": str, "return": str}
+    assert greet.__wrapped__("Bob") == "Hello Bob"  # type: ignore[attr-defined]
+
+
+def test_unparameterized_containers():
+    @runtime_check
+    def bare(xs: list, pair: tuple, table: dict) -> set:  # type: ignore[type-arg]
+        return set(xs) | set(pair) | set(table)
+
+    assert bare([1], ("a", 2), {3: 4}) == {1, "a", 2, 3}
+    with pytest.raises(TypeError):
+        bare((1,), (), {})
+
+
+def test_all_class_signature_emits_only_inline_isinstance():
+    def area(w: int, h: int | float = 1, *, unit: str = "m") -> float:
+        return w * h
+
+    hints = {"w": int, "h": int | float, "unit": str, "return": float}
+    namespace: dict[str, object] = {}
+    src = _emit_wrapper_source(inspect.signature(area), hints, namespace)
+    assert src.count("__rc_isinstance(") == 4
+    assert "__rc_check_" not in src
+
+
+def test_repeated_decoration_reuses_wrapper():
+    def double(x: int) -> int:
+        return 2 * x
+
+    first = runtime_check(double)
+    assert runtime_check(double) is first
+    assert runtime_check(sample=4)(double) is not first
+
+
+def test_none_return_annotation():
+    @runtime_check
+    def store(value: int, sink: list[int]) -> None:
+        sink.append(value)
+
+    @runtime_check
+    def leaky(value: int) -> None:
+        return value  # type: ignore[return-value]
+
+    sink: list[int] = []
+    assert store(1, sink) is None and sink == [1]
+    with pytest.raises(TypeError, match="Return expected"):
+        leaky(1)
+
+
+T = TypeVar("T")
+
+
+def test_any_object_and_typevar_are_not_checked():
+    def anything(x: Any, y: object, z: T) -> Any:
+        return (x, y, z)
+
+    assert runtime_check(anything) is anything
+
+    @runtime_check
+    def first(items: list[Any], pair: tuple[int, Any], extra: Any = None) -> int:
+        return pair[0]
+
+    assert first([1, "a"], (1, object())) == 1
+    with pytest.raises(TypeError):
+        first([], ("1", 2))  # type: ignore[arg-type]
+
+
+def test_reserved_parameter_prefix_is_rejected():
+    def clash(__rc_func: int, y: int) -> int:
+        return __rc_func + y
+
+    with pytest.raises(ValueError, match="__rc_func"):
+        runtime_check(clash)
+
+
+def test_annotation_cache_does_not_retry_errors():
+    calls = []
+
+    @_annotation_cache
+    def failing(anno: object) -> None:
+        calls.append(anno)
+        raise TypeError("boom")
+
+    with pytest.raises(TypeError, match="boom"):
+        failing(int)
+    assert calls == [int]
+    assert _annotation_cache(lambda anno: len(anno))([1, 2]) == 2  # unhashable
+
+
+@runtime_check
+def segment(start: tuple[int, int], end: tuple[int, tuple[int, int]]) -> int:
+    return end[1][1] - start[0]
+
+
+def test_segment_rejects_wrong_length_fixed_tuples():
+    assert segment((1, 2), (3, (4, 5))) == 4
+    with pytest.raises(TypeError):
+        segment((1,), (3, (4, 5)))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        segment((1, 2, 3), (3, (4, 5)))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        segment((1, 2), (3, (4,)))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        segment((1, 2), (3, (4, 5, 6)))  # type: ignore[arg-type]
+
+
+def test_stacked_on_wraps_decorator_passes_arguments_through():
+    def inject(func):  # type: ignore[no-untyped-def]
+        @functools.wraps(func)
+        def inner(*args, **kwargs):  # type: ignore[no-untyped-def]
+            kwargs.setdefault("db", "conn")
+            return func(*args, **kwargs)
+
+        return inner
+
+    @runtime_check
+    @inject
+    def handler(x: int, db: str = "unset") -> str:
+        return db
+
+    assert handler(1) == "conn"
+    assert handler(1, db="other") == "other"
+    with pytest.raises(TypeError):
+        handler("1")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        handler(1, db=2)  # type: ignore[arg-type]
+
+
+def test_defaults_are_applied_by_the_wrapped_function():
+    def shift(x: int, by: int = 1) -> int:
+        return x + by
+
+    wrapped = runtime_check(shift)
+    shift.__defaults__ = (10,)
+    assert wrapped(1) == 11
+
+    @runtime_check
+    def sloppy(x: int = None) -> int:  # type: ignore[assignment]
+        return 0
+
+    assert sloppy(1) == 0
+    with pytest.raises(TypeError, match="Argument 'x'"):
+        sloppy()
+
+
+def test_explicit_signature_is_used_for_checks_only():
+    def count(*args):  # type: ignore[no-untyped-def]
+        return len(args)
+
+    count.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [inspect.Parameter("a", inspect.Parameter.POSITIONAL_OR_KEYWORD, default=0)]
+    )
+    count.__annotations__ = {"a": int}
+    wrapped = runtime_check(count)
+    assert wrapped() == 0 and wrapped(5) == 1
+    with pytest.raises(TypeError):
+        wrapped("5")